@@ -45,3 +45,14 @@ class CORSConfig:
         if self.allowed_origins is None:
             origins = os.getenv("ALLOWED_ORIGINS", "")
             self.allowed_origins = [o.strip() for o in origins.split(",") if o.strip()]
+
+
+@dataclass
+class StartupConfig:
+    """Startup behaviour configuration."""
+
+    profile: bool = None
+
+    def __post_init__(self):
+        if self.profile is None:
+            self.profile = os.getenv("STARTUP_PROFILE", "false").lower() == "true"
@@ -17,6 +17,9 @@ INSERT INTO users (email, password_hash)
 VALUES (?, ?)
 """
 
+# Read statements prepared at startup by SQLiteDB.warmup
+WARMUP_STATEMENTS = (SELECT_USER_BY_EMAIL, SELECT_USER_BY_ID)
+
 
 class AuthQuery:
     def __init__(self, db):
@@ -26,6 +26,9 @@ DELETE_NOTE = """
 DELETE FROM notes WHERE id = ? AND user_id = ?
 """
 
+# Read statements prepared at startup by SQLiteDB.warmup
+WARMUP_STATEMENTS = (SELECT_NOTES_BY_USER, SELECT_NOTE_BY_ID)
+
 
 class NoteQuery:
     def __init__(self, db):
@@ -17,29 +17,67 @@ class SQLiteDB:
 
     async def init(self):
         """Open connection, enable WAL + foreign keys, run migrations."""
+        await self.connect()
+        await self.migrate()
+        logger.info("Database initialised: %s", self._path)
+
+    async def connect(self):
+        """Open connection and enable WAL + foreign keys."""
         self._conn = await aiosqlite.connect(self._path)
         self._conn.row_factory = aiosqlite.Row
         await self._conn.execute("PRAGMA journal_mode=WAL")
         await self._conn.execute("PRAGMA foreign_keys=ON")
-        await self._run_migrations()
-        logger.info("Database initialised: %s", self._path)
 
     async def close(self):
         if self._conn:
             await self._conn.close()
             self._conn = None
 
-    async def _run_migrations(self):
+    async def migrate(self):
+        """Apply migrations newer than the schema version stored in PRAGMA user_version.
+
+        Each file and its version bump run in one transaction, so a crash
+        mid-migration leaves neither applied.
+        """
         from app.db.migrations import get_migration_files
 
-        for migration_file in get_migration_files():
+        cursor = await self._conn.execute("PRAGMA user_version")
+        (applied,) = await cursor.fetchone()
+        migration_files = get_migration_files()
+        if applied > len(migration_files):
+            logger.warning(
+                "Database schema version %d is newer than the %d known migrations",
+                applied, len(migration_files),
+            )
+            return
+        pending = migration_files[applied:]
+        if not pending:
+            logger.info("Migrations up to date (version %d)", applied)
+            return
+
+        for version, migration_file in enumerate(pending, start=applied + 1):
             sql_content = migration_file.read_text()
-            for raw in sql_content.split(";"):
-                stmt = raw.strip()
-                if stmt and not stmt.startswith("--"):
-                    await self._conn.execute(stmt + ";")
-        await self._conn.commit()
-        logger.info("Migrations complete")
+            await self._conn.execute("BEGIN")
+            try:
+                for raw in sql_content.split(";"):
+                    stmt = raw.strip()
+                    if stmt and not stmt.startswith("--"):
+                        await self._conn.execute(stmt + ";")
+                await self._conn.execute(f"PRAGMA user_version = {version}")
+                await self._conn.commit()
+            except Exception:
+                await self._conn.rollback()
+                raise
+        logger.info("Migrations complete (version %d)", applied + len(pending))
+
+    async def warmup(self, statements: tuple[str, ...]):
+        """Prepare read statements so they are in the connection's statement cache.
+
+        Each statement runs once with NULL parameters, which matches no rows.
+        """
+        for sql in statements:
+            cursor = await self._conn.execute(sql, (None,) * sql.count("?"))
+            await cursor.fetchall()
 
     async def execute(self, sql: str, params: tuple = ()) -> aiosqlite.Cursor:
         """Execute a statement and commit."""
@@ -6,6 +6,8 @@ from app.service.auth import AuthService
 from app.service.notes import NoteService
 
 _db_instance: SQLiteDB | None = None
+_auth_service: AuthService | None = None
+_note_service: NoteService | None = None
 
 
 def get_db() -> SQLiteDB:
@@ -18,8 +20,16 @@ def get_db() -> SQLiteDB:
 
 
 def get_auth_service() -> AuthService:
-    return AuthService(db=get_db(), config=AuthConfig())
+    """Shared AuthService singleton (config is read from the environment once)."""
+    global _auth_service
+    if _auth_service is None:
+        _auth_service = AuthService(db=get_db(), config=AuthConfig())
+    return _auth_service
 
 
 def get_note_service() -> NoteService:
-    return NoteService(db=get_db())
+    """Shared NoteService singleton."""
+    global _note_service
+    if _note_service is None:
+        _note_service = NoteService(db=get_db())
+    return _note_service
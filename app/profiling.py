@@ -0,0 +1,36 @@
+"""Startup profiling: import time and lifespan phase timings."""
+
+import logging
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfiler:
+    """Collects named phase timings and logs them as a single report."""
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self._phases: list[tuple[str, float]] = []
+
+    def record(self, name: str, seconds: float):
+        self._phases.append((name, seconds))
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the wrapped block and record it under ``name``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def report(self):
+        if not self.enabled:
+            return
+        total = sum(seconds for _, seconds in self._phases)
+        width = max((len(name) for name, _ in self._phases), default=0)
+        lines = [f"  {name:<{width}}  {seconds * 1000:8.1f} ms" for name, seconds in self._phases]
+        lines.append(f"  {'total':<{width}}  {total * 1000:8.1f} ms")
+        logger.info("Startup profile:\n%s", "\n".join(lines))
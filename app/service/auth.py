@@ -2,18 +2,25 @@
 
 import logging
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
-import jwt
-from passlib.context import CryptContext
-
 from app.config import AuthConfig
 from app.db.query.auth import AuthQuery
 from app.db.sqlite import SQLiteDB
 
 logger = logging.getLogger(__name__)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Low-cost bcrypt hash used only to load the bcrypt backend during warmup.
+_WARMUP_HASH = "$2a$05$CCCCCCCCCCCCCCCCCCCCC.E5YPO9kmyuRGyh0XouQYb4YMJKvyOeW"
+
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """Bcrypt password context, built on first use."""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 class AuthService:
@@ -21,6 +28,12 @@ class AuthService:
         self._query = AuthQuery(db)
         self._config = config
 
+    def warmup(self):
+        """Import jwt and load the bcrypt backend so the first request doesn't pay for it."""
+        import jwt  # noqa: F401
+
+        get_pwd_context().verify("warmup", _WARMUP_HASH)
+
     async def authenticate(self, email: str, password: str) -> Optional[dict]:
         """Validate credentials. Returns user dict or None."""
         user = await self._query.get_user_by_email(email)
@@ -39,6 +52,9 @@ class AuthService:
         return await self._query.create_user(email, hashed)
 
     def create_access_token(self, user_id: int) -> str:
+        # jwt is imported lazily to keep app import fast; warmup() loads it at startup.
+        import jwt
+
         expire = datetime.now(timezone.utc) + timedelta(
             minutes=self._config.access_token_expire_minutes
         )
@@ -47,6 +63,8 @@ class AuthService:
 
     def decode_token(self, token: str) -> Optional[int]:
         """Decode JWT and return user_id, or None if invalid/expired."""
+        import jwt
+
         try:
             payload = jwt.decode(
                 token, self._config.secret_key, algorithms=[self._config.algorithm]
@@ -57,8 +75,8 @@ class AuthService:
 
     @staticmethod
     def hash_password(password: str) -> str:
-        return pwd_context.hash(password)
+        return get_pwd_context().hash(password)
 
     @staticmethod
     def verify_password(plain: str, hashed: str) -> bool:
-        return pwd_context.verify(plain, hashed)
+        return get_pwd_context().verify(plain, hashed)
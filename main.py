@@ -1,25 +1,51 @@
 """FastAPI boilerplate entry point."""
 
+import time
+
+_import_started = time.perf_counter()
+
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from app.config import CORSConfig
-from app.dependencies import get_db
+from app.config import CORSConfig, StartupConfig
+from app.db.query import auth as auth_query
+from app.db.query import notes as notes_query
+from app.dependencies import get_auth_service, get_db, get_note_service
+from app.profiling import StartupProfiler
 from app.view.auth import router as auth_router
 from app.view.notes import router as notes_router
 
 logging.basicConfig(level=logging.INFO)
 
+_import_seconds = time.perf_counter() - _import_started
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Startup: init DB + migrations. Shutdown: close connection."""
+    """Startup: open DB, migrate, build + warm services, warm statement cache. Shutdown: close connection."""
+    app.state.ready = False
+    profiler = StartupProfiler(enabled=StartupConfig().profile)
+    profiler.record("import", _import_seconds)
     db = get_db()
-    await db.init()
+    with profiler.phase("db connect"):
+        await db.connect()
+    with profiler.phase("migrations"):
+        await db.migrate()
+    with profiler.phase("services"):
+        get_auth_service()
+        get_note_service()
+    with profiler.phase("auth warmup"):
+        get_auth_service().warmup()
+    with profiler.phase("db warmup"):
+        await db.warmup(auth_query.WARMUP_STATEMENTS + notes_query.WARMUP_STATEMENTS)
+    profiler.report()
+    app.state.ready = True
     yield
+    app.state.ready = False
     await db.close()
 
 
@@ -51,7 +77,12 @@ async def root():
 
 @app.get("/health", tags=["Health"])
 async def health_check():
-    """Health check endpoint."""
+    """Health check endpoint. Returns 503 until startup warmup has finished."""
+    if not getattr(app.state, "ready", False):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "starting"},
+        )
     return {"status": "healthy"}
 
 